@@ -16,9 +16,9 @@ from contacts.serializers import ContactSerializer
 from domains.models import Domain
 from domains.serializers import DomainSerializer
 from records.models import Record
-from records.serializers import RecordSerializer
+from records.serializers import RecordSerializer, RecordListSerializer
 from shorturls.models import ShortUrl
-from shorturls.serializers import ShortUrlSerializer
+from shorturls.serializers import ShortUrlSerializer, ShortUrlListSerializer
 from subdomains.models import Subdomain
 from subdomains.serializers import SubdomainSerializer
 
@@ -57,6 +57,11 @@ class ShortUrlViewSet(viewsets.ReadOnlyModelViewSet):
         provider = shorturls.providers.get_short_url_provider(None)
         return ShortUrl.list_short_urls(provider, self.request.user)
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ShortUrlListSerializer
+        return super(ShortUrlViewSet, self).get_serializer_class()
+
 
 class SubdomainViewSet(viewsets.ModelViewSet):
     serializer_class = SubdomainSerializer
@@ -64,7 +69,8 @@ class SubdomainViewSet(viewsets.ModelViewSet):
     lookup_field = 'uuid'
 
     def get_queryset(self):
-        return Subdomain.objects.filter(user=self.request.user)
+        return Subdomain.objects.filter(user=self.request.user).select_related(
+            'domain', 'registrant', 'admin', 'tech', 'billing')
 
     def perform_create(self, serializer):
         serializer.save(expiry=datetime.datetime.now() + datetime.timedelta(days=90))
@@ -90,14 +96,28 @@ class RecordViewSet(viewsets.ModelViewSet):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.subdomain = None
+        self.dns_records = None
 
     def dispatch(self, request, *args, **kwargs):
         self.subdomain = get_object_or_404(Subdomain, uuid=kwargs['subdomain_uuid'])
         return super(RecordViewSet, self).dispatch(request, *args, **kwargs)
 
     def get_queryset(self):
-        provider = records.providers.get_dns_record_provider(self.subdomain.domain)
-        return Record.list_dns_records(provider, self.subdomain)
+        if self.dns_records is None:
+            provider = records.providers.get_dns_record_provider(self.subdomain.domain)
+            self.dns_records = Record.list_dns_records(provider, self.subdomain)
+        return self.dns_records
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return RecordListSerializer
+        return super(RecordViewSet, self).get_serializer_class()
+
+    def get_object(self):
+        dns_record = get_object_or_404(Record, uuid=self.kwargs[self.lookup_field],
+                                       subdomain_name=self.subdomain.name, domain=self.subdomain.domain)
+        self.check_object_permissions(self.request, dns_record)
+        return dns_record
 
     def perform_create(self, serializer):
         serializer.save(subdomain=self.subdomain)
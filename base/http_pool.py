@@ -0,0 +1,15 @@
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+_sessions: dict[str, requests.Session] = {}
+
+
+def get_session(host: str) -> requests.Session:
+    """Return a process-wide session for the host, with pooling and retries configured once."""
+    session = _sessions.get(host)
+    if session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=(429, 502, 503, 504), raise_on_status=False)))
+        _sessions[host] = session
+    return session
@@ -1,16 +1,28 @@
-import threading
+import contextvars
+import logging
 import uuid
 
 from django.http import HttpRequest, HttpResponse
 
 from .base import BaseMiddleware
 
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar('request_id', default='-')
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
 
 class CommonMiddleware(BaseMiddleware):
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        threading.current_thread().name = uuid.uuid4()
-        response: HttpResponse = self.get_response(request)
         debug_id = uuid.uuid4().hex
-        self.logger.info(f'Debug ID: {debug_id}')
-        response.headers['Flare-Debug-Id'] = debug_id
-        return response
+        token = request_id_var.set(debug_id)
+        try:
+            response: HttpResponse = self.get_response(request)
+            self.logger.info(f'Debug ID: {debug_id}')
+            response.headers['Flare-Debug-Id'] = debug_id
+            return response
+        finally:
+            request_id_var.reset(token)
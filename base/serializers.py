@@ -0,0 +1,18 @@
+import copy
+
+
+class CachedFieldsSerializerMixin:
+    """Builds the serializer's field dict once per class.
+
+    ModelSerializer.get_fields() re-introspects the model meta on every
+    instantiation. Serializers whose fields do not depend on the request can
+    mix this in to build the dict once and hand out shallow per-instance
+    copies, which is safe because DRF rebinds fields on each serializer.
+    """
+    _base_fields_cache = None
+
+    def get_fields(self):
+        cls = type(self)
+        if cls._base_fields_cache is None:
+            cls._base_fields_cache = super().get_fields()
+        return {k: copy.copy(v) for k, v in cls._base_fields_cache.items()}
@@ -9,7 +9,6 @@ https://docs.djangoproject.com/en/4.0/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
-import datetime
 import os
 from pathlib import Path
 
@@ -193,16 +192,19 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'logback': {
-            'format': '{asctime} {levelname} {process:d} --- [{threadName}] {name}: {message}',
+            'format': '{asctime} {levelname} {process:d} --- [{threadName}] [{request_id}] {name}: {message}',
             'style': '{',
         },
     },
     'filters': {
+        'request_id': {
+            '()': 'base.middleware.common.RequestIdFilter',
+        },
     },
     'handlers': {
         'console': {
             'level': 'INFO',
-            'filters': (),
+            'filters': ('request_id',),
             'class': 'logging.StreamHandler',
             'formatter': 'logback',
         },
@@ -213,10 +215,10 @@ LOGGING = {
         },
         'file': {
             'level': 'INFO',
-            'filters': (),
-            'class': 'logging.handlers.RotatingFileHandler',
-            'filename': BASE_DIR / f'logs/{datetime.date.today()}_{APPLICATION_TYPE.name}.log',
-            'maxBytes': 1024 * 1024 * 5,
+            'filters': ('request_id',),
+            'class': 'logging.handlers.TimedRotatingFileHandler',
+            'filename': BASE_DIR / f'logs/{APPLICATION_TYPE.name}.log',
+            'when': 'midnight',
             'backupCount': 5,
             'formatter': 'logback',
             'encoding': 'utf-8',
@@ -273,6 +275,10 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'base.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 20,
 }
@@ -24,18 +24,7 @@ class Contact(models.Model):
 
     def to_whois(self, is_private: bool = False,
                  contact_url: str | None = None, public_fields: list[str] = ()) -> dict[str, str]:
-        def is_private_field(k: str) -> bool:
-            return is_private and k not in public_fields
-
-        def redact_data(whois: dict[str, str], message: str = 'DATA REDACTED') -> dict[str, str]:
-            for k in whois.keys():
-                if is_private_field(k):
-                    whois[k] = message
-                    if k == 'email' and contact_url is not None:
-                        whois[k] = contact_url
-            return whois
-
-        return redact_data({
+        whois = {
             'name': self.name,
             'organization': self.organization,
             'street': self.street,
@@ -46,7 +35,12 @@ class Contact(models.Model):
             'phone': self.phone,
             'fax': self.fax,
             'email': self.email,
-        })
+        }
+        if is_private:
+            for k in whois:
+                if k not in public_fields:
+                    whois[k] = contact_url if k == 'email' and contact_url is not None else 'DATA REDACTED'
+        return whois
 
     def __str__(self):
         return self.name
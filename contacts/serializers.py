@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from base.serializers import CachedFieldsSerializerMixin
 from .models import Contact
 
 
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from base.serializers import CachedFieldsSerializerMixin
 from .models import Domain
 
 
-class DomainSerializer(serializers.ModelSerializer):
+class DomainSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Domain
         fields = (
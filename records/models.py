@@ -1,9 +1,9 @@
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 import uuid
 from django.core.cache import cache
-from django.db import models
+from django.db import models, transaction
 
 from domains.models import Domain
 from subdomains.models import Subdomain
@@ -27,7 +27,7 @@ class Record(models.Model):
 
     provider_id = models.CharField(max_length=255, unique=True, null=True)
 
-    subdomain_name = models.CharField(max_length=63)
+    subdomain_name = models.CharField(max_length=63, db_index=True)
     domain = models.ForeignKey(Domain, on_delete=models.RESTRICT)
 
     name = models.CharField('Name', max_length=63)
@@ -43,6 +43,8 @@ class Record(models.Model):
 
     target = models.CharField('Target', max_length=255)
 
+    DOTTED_TARGET_TYPES = frozenset(('NS', 'CNAME', 'MX', 'SRV',))
+
     @property
     def full_name(self) -> str:
         return self.join_name(self.service, self.protocol, self.name)
@@ -83,41 +85,62 @@ class Record(models.Model):
         if subdomain is None:
             return []
         cache_key = 'dns_records:' + str(subdomain)
-        cache_value = cache.get(cache_key)
-        if cache_value is not None:
-            return cache_value
+        cached_dns_record_ids = cache.get(cache_key)
+        if cached_dns_record_ids is not None:
+            cached_dns_records = cache.get_many(['dns_records:' + str(x) for x in cached_dns_record_ids])
+            if len(cached_dns_records) == len(cached_dns_record_ids):
+                return [cached_dns_records['dns_records:' + str(x)] for x in cached_dns_record_ids]
         if provider:
-            try:
-                provider_dns_records = provider.list_dns_records(subdomain.name, subdomain.domain)
-                provider_dns_record_id_set = set(map(lambda x: x['provider_id'], provider_dns_records))
-                for dns_record in cls.objects.filter(subdomain_name=subdomain.name):
-                    if dns_record.provider_id not in provider_dns_record_id_set:
-                        dns_record.delete()
-                dns_record_dict = {provider_id: x for provider_id, x in
-                                   map(lambda x: (x.provider_id, x), cls.objects.filter(subdomain_name=subdomain.name))}
+            cls.reconcile_provider_dns_records(provider, subdomain)
+        dns_records = cls.objects.filter(subdomain_name=subdomain.name).order_by('type', 'name', '-id')
+        cache.set(cache_key, [x.id for x in dns_records], timeout=3600)
+        if dns_records:
+            cache.set_many({'dns_records:' + str(x.id): x for x in dns_records},
+                           timeout=min(x.ttl for x in dns_records))
+        return dns_records
+
+    @classmethod
+    def reconcile_provider_dns_records(cls, provider: BaseDnsRecordProvider, subdomain: Subdomain) -> None:
+        try:
+            provider_dns_records = provider.list_dns_records(subdomain.name, subdomain.domain)
+            provider_dns_record_id_set = {x['provider_id'] for x in provider_dns_records}
+            with transaction.atomic():
+                existing_dns_records = list(cls.objects.filter(subdomain_name=subdomain.name))
+                stale_dns_record_ids = [x.id for x in existing_dns_records
+                                        if x.provider_id not in provider_dns_record_id_set]
+                if stale_dns_record_ids:
+                    cls.objects.filter(id__in=stale_dns_record_ids).delete()
+                dns_record_dict = {x.provider_id: x for x in existing_dns_records
+                                   if x.provider_id in provider_dns_record_id_set}
+                dns_records_to_update = []
+                fields_to_update = set()
+                dns_records_to_create = []
                 for provider_dns_record in provider_dns_records:
                     provider_id = provider_dns_record.get('provider_id')
-                    if provider_id in dns_record_dict:
-                        dns_record_dict.get(provider_id).update_by_provider_dns_record(provider_dns_record)
+                    dns_record = dns_record_dict.get(provider_id)
+                    if dns_record is not None:
+                        changed_fields = dns_record.update_by_provider_dns_record(provider_dns_record)
+                        if changed_fields:
+                            dns_records_to_update.append(dns_record)
+                            fields_to_update.update(changed_fields)
                         continue
                     provider_dns_record.update({
                         'subdomain_name': subdomain.name,
                         'domain': subdomain.domain,
                     })
-                    cls.objects.update_or_create(provider_id=provider_id, defaults=provider_dns_record)
-            except DnsRecordProviderError as e:
-                logging.error(e)
-        dns_records = cls.objects.filter(subdomain_name=subdomain.name).order_by('type', 'name', '-id')
-        cache.set(cache_key, dns_records, timeout=3600)
-        for dns_record in dns_records:
-            cache.set('dns_records:' + str(dns_record.id), dns_record, timeout=dns_record.ttl)
-        return dns_records
+                    dns_records_to_create.append(cls(**provider_dns_record))
+                if dns_records_to_update:
+                    cls.objects.bulk_update(dns_records_to_update, fields=sorted(fields_to_update))
+                if dns_records_to_create:
+                    cls.objects.bulk_create(dns_records_to_create, ignore_conflicts=True)
+        except DnsRecordProviderError as e:
+            logging.error(e)
 
     @classmethod
     def create_dns_record(cls, provider: BaseDnsRecordProvider | None, subdomain: Subdomain, **kwargs) -> 'Record':
         if not kwargs.get('name', '').endswith(subdomain.name):
             raise DnsRecordBadRequestError('Name is invalid.')
-        if kwargs.get('type') in ('NS', 'CNAME', 'MX', 'SRV',) and not kwargs.get('target').endswith('.'):
+        if kwargs.get('type') in cls.DOTTED_TARGET_TYPES and not kwargs.get('target').endswith('.'):
             kwargs['target'] = kwargs.get('target') + '.'
         dns_record = cls(subdomain_name=subdomain.name, domain=subdomain.domain, **kwargs)
         if provider:
@@ -134,8 +157,7 @@ class Record(models.Model):
     @classmethod
     def retrieve_dns_record(cls, provider: BaseDnsRecordProvider | None, subdomain: Subdomain, id: int) -> 'Record':
         cache_key = 'dns_records:' + str(id)
-        cache_value = cache.get(cache_key,
-                                next(filter(lambda x: x.id == id, cache.get('records:' + str(subdomain), [])), None))
+        cache_value = cache.get(cache_key)
         if cache_value is not None:
             return cache_value
         try:
@@ -148,12 +170,13 @@ class Record(models.Model):
                         dns_record.delete()
                         dns_record = None
                     else:
-                        dns_record.update_by_provider_dns_record(provider_dns_record)
+                        changed_fields = dns_record.update_by_provider_dns_record(provider_dns_record)
+                        if changed_fields:
+                            dns_record.save(update_fields=changed_fields)
                 except DnsRecordProviderError as e:
                     logging.error(e)
             if dns_record is None:
-                cache.delete('dns_records:' + str(subdomain))
-                cache.delete('dns_records:' + str(id))
+                cache.delete_many(['dns_records:' + str(subdomain), 'dns_records:' + str(id)])
             else:
                 cache.set(cache_key, dns_record, timeout=dns_record.ttl)
             return dns_record
@@ -165,7 +188,7 @@ class Record(models.Model):
                           **kwargs) -> 'Record':
         if 'name' in kwargs.keys() and not kwargs.get('name', '').endswith(subdomain.name):
             raise DnsRecordBadRequestError('Name is invalid.')
-        if kwargs.get('type') in ('NS', 'CNAME', 'MX', 'SRV',) and not kwargs.get('target').endswith('.'):
+        if kwargs.get('type') in cls.DOTTED_TARGET_TYPES and not kwargs.get('target').endswith('.'):
             kwargs['target'] = kwargs.get('target') + '.'
         try:
             dns_record = cls.objects.get(subdomain_name=subdomain.name, pk=id)
@@ -195,19 +218,19 @@ class Record(models.Model):
                 except DnsRecordProviderError as e:
                     logging.error(e)
             dns_record.delete()
-            cache.delete('dns_records:' + str(subdomain))
-            cache.delete('dns_records:' + str(id))
+            cache.delete_many(['dns_records:' + str(subdomain), 'dns_records:' + str(id)])
         except cls.DoesNotExist:
             raise DnsRecordNotFoundError()
 
     @classmethod
-    def export_zone(cls, provider: BaseDnsRecordProvider | None, subdomain: Subdomain) -> str:
-        return '\n'.join(map(str, cls.list_dns_records(provider, subdomain)))
+    def export_zone(cls, provider: BaseDnsRecordProvider | None, subdomain: Subdomain) -> Iterator[str]:
+        return map(str, cls.list_dns_records(provider, subdomain))
 
     @classmethod
     def import_zone(cls, provider: BaseDnsRecordProvider | None, subdomain: Subdomain, zone: str) -> None:
-        lines = list(filter(lambda x: x[0] != ';', map(lambda x: x.strip(), zone.splitlines())))
-        for line in lines:
+        for line in map(str.strip, zone.splitlines()):
+            if not line or line.startswith(';'):
+                continue
             cls.create_dns_record(provider, subdomain, **cls.parse_dns_record(line))
 
     @staticmethod
@@ -224,7 +247,7 @@ class Record(models.Model):
             service = '_' + service
         if protocol is not None and not protocol.startswith('_'):
             protocol = '_' + protocol
-        return '.'.join(filter(lambda x: x is not None, [service, protocol, name]))
+        return '.'.join(x for x in (service, protocol, name) if x is not None)
 
     @staticmethod
     def split_data(data: str) -> tuple[int | None, int | None, int | None, str]:
@@ -237,7 +260,7 @@ class Record(models.Model):
 
     @staticmethod
     def join_data(priority: int | None, weight: int | None, port: int | None, target: str) -> str:
-        return ' '.join(map(str, filter(lambda x: x is not None, [priority, weight, port, target])))
+        return ' '.join(str(x) for x in (priority, weight, port, target) if x is not None)
 
     @classmethod
     def parse_dns_record(cls, raw_record: str) -> dict[str, Any]:
@@ -263,12 +286,8 @@ class Record(models.Model):
             cls.list_dns_records(provider, subdomain)
         logging.info('End synchronizing records.')
 
-    def update_by_provider_dns_record(self, provider_dns_record: dict[str, Any]) -> bool:
-        is_updated = False
-        for k, v in provider_dns_record.items():
-            if getattr(self, k) != v:
-                setattr(self, k, v)
-                is_updated = True
-        if is_updated:
-            self.save()
-        return is_updated
+    def update_by_provider_dns_record(self, provider_dns_record: dict[str, Any]) -> list[str]:
+        changed_fields = [k for k, v in provider_dns_record.items() if getattr(self, k) != v]
+        for k in changed_fields:
+            setattr(self, k, provider_dns_record[k])
+        return changed_fields
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 from domains.models import Domain
 from .base import BaseDnsRecordProvider
@@ -18,5 +19,10 @@ class DnsRecordProvider(Enum):
         self.provider_class = provider_class
 
 
+@lru_cache(maxsize=None)
+def _get_provider_instance(provider: DnsRecordProvider) -> BaseDnsRecordProvider:
+    return provider.provider_class()
+
+
 def get_dns_record_provider(domain: Domain) -> BaseDnsRecordProvider:
-    return DnsRecordProvider[domain.dns_record_provider].provider_class()
+    return _get_provider_instance(DnsRecordProvider[domain.dns_record_provider])
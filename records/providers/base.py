@@ -1,8 +1,20 @@
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 from domains.models import Domain
 
+# Connect/read timeouts for provider API calls, so a stalled upstream cannot pin a worker.
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+@lru_cache(maxsize=None)
+def get_record_model() -> type:
+    # Imported lazily: records.models imports this package, so a module-level
+    # import here would be circular.
+    from ..models import Record
+    return Record
+
 
 class BaseDnsRecordProvider(metaclass=ABCMeta):
     @abstractmethod
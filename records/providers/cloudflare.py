@@ -4,8 +4,9 @@ from typing import Any
 import requests
 from django.core.cache import cache
 
+from base.http_pool import get_session
 from domains.models import Domain
-from .base import BaseDnsRecordProvider
+from .base import BaseDnsRecordProvider, get_record_model
 from ..exceptions import DnsRecordProviderError
 
 
@@ -15,22 +16,24 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
     headers = {
         'Authorization': f'Bearer {api_token}',
     }
+    session = get_session(host)
 
     def list_dns_records(self, subdomain_name: str, domain: Domain) -> list[dict[str, Any]]:
-        response = requests.get(self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records',
-                                headers=self.headers, params={
-                                    'per_page': 50000,
-                                })
+        response = self.session.get(self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records',
+                                    headers=self.headers, params={
+                                        'per_page': 50000,
+                                    })
         try:
             response.raise_for_status()
         except requests.HTTPError:
             raise DnsRecordProviderError(response.json())
-        return list(filter(lambda x: x.get('name').endswith(subdomain_name),
-                           map(self.from_cloudflare_dns_record, response.json().get('result'))))
+        return [self.from_cloudflare_dns_record(x) for x in response.json().get('result')
+                if x.get('name').endswith(subdomain_name)]
 
     def create_dns_record(self, subdomain_name: str, domain: Domain, **kwargs) -> dict[str, Any]:
-        response = requests.post(self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records',
-                                 headers=self.headers, json=self.to_cloudflare_dns_record(kwargs))
+        response = self.session.post(
+            self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records',
+            headers=self.headers, json=self.to_cloudflare_dns_record(kwargs))
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -38,7 +41,7 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_cloudflare_dns_record(response.json().get('result'))
 
     def retrieve_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> dict[str, Any] | None:
-        response = requests.get(
+        response = self.session.get(
             self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records/{provider_id}',
             headers=self.headers)
         try:
@@ -48,7 +51,7 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_cloudflare_dns_record(response.json().get('result'))
 
     def update_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str, **kwargs) -> dict[str, Any]:
-        response = requests.put(
+        response = self.session.put(
             self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records/{provider_id}',
             headers=self.headers, json=self.to_cloudflare_dns_record(kwargs))
         try:
@@ -58,7 +61,7 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_cloudflare_dns_record(response.json().get('result'))
 
     def delete_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> None:
-        response = requests.delete(
+        response = self.session.delete(
             self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}/dns_records/{provider_id}',
             headers=self.headers)
         try:
@@ -67,7 +70,7 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
             raise DnsRecordProviderError(response.json())
 
     def get_nameservers(self, domain: Domain = None) -> list[str]:
-        response = requests.get(self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}')
+        response = self.session.get(self.host + f'/client/v4/zones/{self.get_zone_identifier(domain.name)}')
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -79,7 +82,7 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
         cache_value = cache.get(cache_key)
         if cache_value is not None:
             return cache_value
-        response = requests.get(self.host + '/client/v4/zones', headers=self.headers)
+        response = self.session.get(self.host + '/client/v4/zones', headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -91,9 +94,9 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
 
     @staticmethod
     def from_cloudflare_dns_record(cloudflare_dns_record: dict[str, Any]) -> dict[str, Any]:
-        from ..models import Record
-        service, protocol, name = Record.split_name(cloudflare_dns_record.get('name'))
-        _, weight, port, target = Record.split_data(cloudflare_dns_record.get('content'))
+        record_model = get_record_model()
+        service, protocol, name = record_model.split_name(cloudflare_dns_record.get('name'))
+        _, weight, port, target = record_model.split_data(cloudflare_dns_record.get('content'))
         return {
             'provider_id': cloudflare_dns_record.get('id'),
             'name': name,
@@ -109,10 +112,10 @@ class CloudflareDnsRecordProvider(BaseDnsRecordProvider):
 
     @staticmethod
     def to_cloudflare_dns_record(dns_record: dict[str, Any]) -> dict[str, Any]:
-        from ..models import Record
-        content = Record.join_data(dns_record.get('priority'), dns_record.get('weight'), dns_record.get('port'),
-                                   dns_record.get('target'))
-        name = Record.join_name(dns_record.get('service'), dns_record.get('protocol'), dns_record.get('name'))
+        record_model = get_record_model()
+        content = record_model.join_data(dns_record.get('priority'), dns_record.get('weight'), dns_record.get('port'),
+                                         dns_record.get('target'))
+        name = record_model.join_name(dns_record.get('service'), dns_record.get('protocol'), dns_record.get('name'))
         return {
             'content': content,
             'name': name,
@@ -1,10 +1,12 @@
 import os
 from typing import Any
 
+import orjson
 import requests
 
+from base.http_pool import get_session
 from domains.models import Domain
-from .base import BaseDnsRecordProvider
+from .base import BaseDnsRecordProvider, REQUEST_TIMEOUT, get_record_model
 from ..exceptions import DnsRecordProviderError
 
 
@@ -14,22 +16,23 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
     headers = {
         'Authorization': f'Bearer {token}',
     }
+    session = get_session(host)
 
     def list_dns_records(self, subdomain_name: str, domain: Domain) -> list[dict[str, Any]]:
-        response = requests.get(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
-                                params={
-                                    'per_page': 200,
-                                })
+        response = self.session.get(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
+                                    params={
+                                        'per_page': 200,
+                                    }, timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
             raise DnsRecordProviderError(response.json())
-        return list(filter(lambda x: x.get('name').endswith(subdomain_name),
-                           map(self.from_digitalocean_dns_record, response.json().get('domain_records'))))
+        return [self.from_digitalocean_dns_record(x) for x in orjson.loads(response.content).get('domain_records')
+                if x.get('name').endswith(subdomain_name)]
 
     def create_dns_record(self, subdomain_name: str, domain: Domain, **kwargs) -> dict[str, Any]:
-        response = requests.post(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
-                                 json=self.to_digitalocean_dns_record(kwargs))
+        response = self.session.post(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
+                                     json=self.to_digitalocean_dns_record(kwargs), timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -37,7 +40,8 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_digitalocean_dns_record(response.json().get('domain_record'))
 
     def retrieve_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> dict[str, Any] | None:
-        response = requests.get(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers)
+        response = self.session.get(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                    headers=self.headers, timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -45,8 +49,9 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_digitalocean_dns_record(response.json().get('domain_record'))
 
     def update_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str, **kwargs) -> dict[str, Any]:
-        response = requests.put(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers,
-                                json=self.to_digitalocean_dns_record(kwargs))
+        response = self.session.put(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                    headers=self.headers, json=self.to_digitalocean_dns_record(kwargs),
+                                    timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -54,7 +59,8 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_digitalocean_dns_record(response.json().get('domain_record'))
 
     def delete_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> None:
-        response = requests.delete(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers)
+        response = self.session.delete(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                       headers=self.headers, timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -69,8 +75,7 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
 
     @staticmethod
     def from_digitalocean_dns_record(digitalocean_dns_record: dict[str, Any]) -> dict[str, Any]:
-        from ..models import Record
-        service, protocol, name = Record.split_name(digitalocean_dns_record.get('name'))
+        service, protocol, name = get_record_model().split_name(digitalocean_dns_record.get('name'))
         return {
             'provider_id': str(digitalocean_dns_record.get('id')),
             'name': name,
@@ -86,8 +91,8 @@ class DigitalOceanDnsRecordProvider(BaseDnsRecordProvider):
 
     @staticmethod
     def to_digitalocean_dns_record(dns_record: dict[str, Any]) -> dict[str, Any]:
-        from ..models import Record
-        name = Record.join_name(dns_record.get('service'), dns_record.get('protocol'), dns_record.get('name'))
+        name = get_record_model().join_name(dns_record.get('service'), dns_record.get('protocol'),
+                                            dns_record.get('name'))
         return {
             'name': name,
             'ttl': dns_record.get('ttl'),
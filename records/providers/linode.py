@@ -4,6 +4,7 @@ from typing import Any
 import requests
 from django.core.cache import cache
 
+from base.http_pool import get_session
 from domains.models import Domain
 from .base import BaseDnsRecordProvider
 from ..exceptions import DnsRecordProviderError
@@ -15,22 +16,23 @@ class LinodeDnsRecordProvider(BaseDnsRecordProvider):
     headers = {
         'Authorization': f'Bearer {token}',
     }
+    session = get_session(host)
 
     def list_dns_records(self, subdomain_name: str, domain: Domain) -> list[dict[str, Any]]:
-        response = requests.get(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records',
-                                headers=self.headers, params={
+        response = self.session.get(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records',
+                                    headers=self.headers, params={
                 'page_size': 500,
             })
         try:
             response.raise_for_status()
         except requests.HTTPError:
             raise DnsRecordProviderError(response.json())
-        return list(filter(lambda x: x.get('name').endswith(subdomain_name),
-                           map(self.from_linode_dns_record, response.json().get('data'))))
+        return [self.from_linode_dns_record(x) for x in response.json().get('data')
+                if x.get('name').endswith(subdomain_name)]
 
     def create_dns_record(self, subdomain_name: str, domain: Domain, **kwargs) -> dict[str, Any]:
-        response = requests.post(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records',
-                                 headers=self.headers, json=self.to_linode_dns_record(kwargs))
+        response = self.session.post(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records',
+                                     headers=self.headers, json=self.to_linode_dns_record(kwargs))
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -38,8 +40,8 @@ class LinodeDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_linode_dns_record(response.json())
 
     def retrieve_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> dict[str, Any] | None:
-        response = requests.get(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}',
-                                headers=self.headers)
+        response = self.session.get(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}',
+                                    headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -47,8 +49,8 @@ class LinodeDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_linode_dns_record(response.json())
 
     def update_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str, **kwargs) -> dict[str, Any]:
-        response = requests.put(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}',
-                                headers=self.headers, json=self.to_linode_dns_record(kwargs))
+        response = self.session.put(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}',
+                                    headers=self.headers, json=self.to_linode_dns_record(kwargs))
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -56,8 +58,8 @@ class LinodeDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_linode_dns_record(response.json())
 
     def delete_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> None:
-        response = requests.delete(self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}',
-                                   headers=self.headers)
+        response = self.session.delete(
+            self.host + f'/v4/domains/{self.get_domain_id(domain.name)}/records/{provider_id}', headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -77,7 +79,7 @@ class LinodeDnsRecordProvider(BaseDnsRecordProvider):
         cache_value = cache.get(cache_key)
         if cache_value is not None:
             return cache_value
-        response = requests.get(self.host + '/v4/domains', headers=self.headers)
+        response = self.session.get(self.host + '/v4/domains', headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -3,6 +3,7 @@ from typing import Any
 
 import requests
 
+from base.http_pool import get_session
 from domains.models import Domain
 from .base import BaseDnsRecordProvider
 from ..exceptions import DnsRecordProviderError
@@ -14,22 +15,23 @@ class VultrDnsRecordProvider(BaseDnsRecordProvider):
     headers = {
         'Authorization': f'Bearer {api_key}',
     }
+    session = get_session(host)
 
     def list_dns_records(self, subdomain_name: str, domain: Domain) -> list[dict[str, Any]]:
-        response = requests.get(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
-                                params={
-                                    'per_page': 500,
-                                })
+        response = self.session.get(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
+                                    params={
+                                        'per_page': 500,
+                                    })
         try:
             response.raise_for_status()
         except requests.HTTPError:
             raise DnsRecordProviderError(response.json())
-        return list(filter(lambda x: x.get('name').endswith(subdomain_name),
-                           map(self.from_vultr_dns_record, response.json().get('records'))))
+        return [self.from_vultr_dns_record(x) for x in response.json().get('records')
+                if x.get('name').endswith(subdomain_name)]
 
     def create_dns_record(self, subdomain_name: str, domain: Domain, **kwargs) -> dict[str, Any]:
-        response = requests.post(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
-                                 json=self.to_vultr_dns_record(kwargs))
+        response = self.session.post(self.host + f'/v2/domains/{domain.name}/records', headers=self.headers,
+                                     json=self.to_vultr_dns_record(kwargs))
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -37,7 +39,8 @@ class VultrDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_vultr_dns_record(response.json().get('record'))
 
     def retrieve_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> dict[str, Any] | None:
-        response = requests.get(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers)
+        response = self.session.get(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                    headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -45,8 +48,8 @@ class VultrDnsRecordProvider(BaseDnsRecordProvider):
         return self.from_vultr_dns_record(response.json().get('record'))
 
     def update_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str, **kwargs) -> dict[str, Any]:
-        response = requests.patch(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers,
-                                  json=self.to_vultr_dns_record(kwargs))
+        response = self.session.patch(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                      headers=self.headers, json=self.to_vultr_dns_record(kwargs))
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -57,7 +60,8 @@ class VultrDnsRecordProvider(BaseDnsRecordProvider):
         return kwargs
 
     def delete_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> None:
-        response = requests.delete(self.host + f'/v2/domains/{domain.name}/records/{provider_id}', headers=self.headers)
+        response = self.session.delete(self.host + f'/v2/domains/{domain.name}/records/{provider_id}',
+                                       headers=self.headers)
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
+from base.serializers import CachedFieldsSerializerMixin
 from . import providers
 from .models import Record
 
 
-class RecordSerializer(serializers.ModelSerializer):
+class RecordSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Record
         fields = (
@@ -48,3 +49,24 @@ class RecordSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         provider = providers.get_dns_record_provider(validated_data.get('subdomain').domain)
         return Record.update_dns_record(provider, id=instance.id, **validated_data)
+
+
+class RecordListSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    uuid = serializers.UUIDField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    subdomain_uuid = serializers.ReadOnlyField()
+    subdomain_name = serializers.CharField(read_only=True)
+    domain_uuid = serializers.ReadOnlyField()
+    domain_name = serializers.ReadOnlyField()
+    name = serializers.CharField(read_only=True)
+    ttl = serializers.IntegerField(read_only=True)
+    type = serializers.CharField(read_only=True)
+    service = serializers.CharField(read_only=True, allow_null=True)
+    protocol = serializers.CharField(read_only=True, allow_null=True)
+    priority = serializers.IntegerField(read_only=True, allow_null=True)
+    weight = serializers.IntegerField(read_only=True, allow_null=True)
+    port = serializers.IntegerField(read_only=True, allow_null=True)
+    target = serializers.CharField(read_only=True)
+    full_name = serializers.ReadOnlyField()
+    data = serializers.ReadOnlyField()
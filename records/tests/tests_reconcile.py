@@ -0,0 +1,154 @@
+import datetime
+from typing import Any
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts.tests import get_mock_users
+from contacts.tests import get_mock_contacts
+from domains.models import Domain
+from domains.tests import get_mock_domains
+from records.models import Record
+from records.providers.base import BaseDnsRecordProvider
+from subdomains.tests import get_mock_subdomains
+from .tests import get_mock_dns_records
+
+
+def get_mock_provider_dns_record(**kwargs) -> dict[str, Any]:
+    provider_dns_record = {
+        'provider_id': '1',
+        'name': 'test',
+        'ttl': 3600,
+        'type': 'A',
+        'service': None,
+        'protocol': None,
+        'target': '127.0.0.1',
+        'priority': None,
+        'weight': None,
+        'port': None,
+    }
+    provider_dns_record.update(kwargs)
+    return provider_dns_record
+
+
+class StubDnsRecordProvider(BaseDnsRecordProvider):
+    def __init__(self, dns_records: list[dict[str, Any]] | None = None):
+        self.dns_records = dns_records if dns_records is not None else []
+        self.list_calls = 0
+
+    def list_dns_records(self, subdomain_name: str, domain: Domain) -> list[dict[str, Any]]:
+        self.list_calls += 1
+        return [dict(x) for x in self.dns_records]
+
+    def create_dns_record(self, subdomain_name: str, domain: Domain, **kwargs) -> dict[str, Any]:
+        return kwargs
+
+    def retrieve_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> dict[str, Any] | None:
+        return next((x for x in self.dns_records if x.get('provider_id') == provider_id), None)
+
+    def update_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str, **kwargs) -> dict[str, Any]:
+        return kwargs
+
+    def delete_dns_record(self, subdomain_name: str, domain: Domain, provider_id: str) -> None:
+        pass
+
+    def get_nameservers(self, domain: Domain = None) -> list[str]:
+        return []
+
+
+class BaseDnsRecordTestCase(TestCase):
+    def setUp(self) -> None:
+        self.user = get_mock_users(
+            username='alice', password='test', email='alice@example.com',
+            first_name='Alice', last_name='Test',
+        )[0]
+        self.domain = get_mock_domains(
+            name='example.com',
+            user=self.user,
+        )[0]
+        self.contact = get_mock_contacts(
+            user=self.user,
+            name='test',
+            street='test',
+            city='test',
+            state_province='test',
+            postal_code='0',
+            country='US',
+            phone='+1.1234567890',
+            email='test@example.com',
+        )[0]
+        self.subdomain = get_mock_subdomains(
+            user=self.user,
+            name='test',
+            domain=self.domain,
+            expiry=datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=90),
+            registrant=self.contact,
+            admin=self.contact,
+            tech=self.contact,
+            billing=self.contact,
+        )[0]
+        self.record = get_mock_dns_records(
+            provider_id='1',
+            subdomain_name='test',
+            domain=self.domain,
+            name='test',
+            type='A',
+            target='127.0.0.1',
+        )[0]
+        cache.clear()
+
+
+class DnsRecordReconcileTest(BaseDnsRecordTestCase):
+    def test_reconcile_updates_changed_record(self):
+        provider = StubDnsRecordProvider([get_mock_provider_dns_record(ttl=300, target='1.1.1.1')])
+        Record.reconcile_provider_dns_records(provider, self.subdomain)
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.ttl, 300)
+        self.assertEqual(self.record.target, '1.1.1.1')
+
+    def test_reconcile_creates_missing_record(self):
+        provider = StubDnsRecordProvider([
+            get_mock_provider_dns_record(),
+            get_mock_provider_dns_record(provider_id='2', name='www.test', target='127.0.0.2'),
+        ])
+        Record.reconcile_provider_dns_records(provider, self.subdomain)
+        self.assertEqual(Record.objects.filter(subdomain_name='test').count(), 2)
+        created = Record.objects.get(provider_id='2')
+        self.assertEqual(created.name, 'www.test')
+        self.assertEqual(created.target, '127.0.0.2')
+        self.assertEqual(created.domain, self.domain)
+
+    def test_reconcile_deletes_stale_records(self):
+        provider = StubDnsRecordProvider([get_mock_provider_dns_record(provider_id='2', name='www.test')])
+        Record.reconcile_provider_dns_records(provider, self.subdomain)
+        self.assertFalse(Record.objects.filter(provider_id='1').exists())
+        self.assertTrue(Record.objects.filter(provider_id='2').exists())
+
+
+class DnsRecordCacheTest(BaseDnsRecordTestCase):
+    def test_list_dns_records_caches_listing(self):
+        provider = StubDnsRecordProvider([get_mock_provider_dns_record()])
+        first = Record.list_dns_records(provider, self.subdomain)
+        second = Record.list_dns_records(provider, self.subdomain)
+        self.assertEqual(provider.list_calls, 1)
+        self.assertEqual(list(first), list(second))
+
+    def test_create_dns_record_invalidates_listing(self):
+        Record.list_dns_records(None, self.subdomain)
+        created = Record.create_dns_record(None, self.subdomain, **{
+            'name': 'test',
+            'ttl': 3600,
+            'type': 'AAAA',
+            'service': None,
+            'protocol': None,
+            'priority': None,
+            'weight': None,
+            'port': None,
+            'target': '::1',
+        })
+        self.assertIn(created, Record.list_dns_records(None, self.subdomain))
+
+    def test_delete_dns_record_invalidates_listing(self):
+        Record.list_dns_records(None, self.subdomain)
+        Record.delete_dns_record(None, self.subdomain, self.record.id)
+        self.assertNotIn(self.record, Record.list_dns_records(None, self.subdomain))
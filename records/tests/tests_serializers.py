@@ -0,0 +1,65 @@
+import datetime
+
+from django.test import TestCase
+
+from accounts.tests import get_mock_users
+from contacts.tests import get_mock_contacts
+from domains.tests import get_mock_domains
+from records.serializers import RecordSerializer, RecordListSerializer
+from subdomains.tests import get_mock_subdomains
+from .tests import get_mock_dns_records
+
+
+class RecordListSerializerTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_mock_users(
+            username='alice', password='test', email='alice@example.com',
+            first_name='Alice', last_name='Test',
+        )[0]
+        self.domain = get_mock_domains(
+            name='example.com',
+            user=self.user,
+        )[0]
+        self.contact = get_mock_contacts(
+            user=self.user,
+            name='test',
+            street='test',
+            city='test',
+            state_province='test',
+            postal_code='0',
+            country='US',
+            phone='+1.1234567890',
+            email='test@example.com',
+        )[0]
+        self.subdomain = get_mock_subdomains(
+            user=self.user,
+            name='test',
+            domain=self.domain,
+            expiry=datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=90),
+            registrant=self.contact,
+            admin=self.contact,
+            tech=self.contact,
+            billing=self.contact,
+        )[0]
+        self.record = get_mock_dns_records(
+            subdomain_name='test',
+            domain=self.domain,
+            name='test',
+            type='SRV',
+            service='_sip',
+            protocol='_tcp',
+            priority=10,
+            weight=100,
+            port=5060,
+            target='sip.example.com.',
+        )[0]
+
+    def test_matches_record_serializer_output(self):
+        expected = RecordSerializer(self.record).data
+        result = RecordListSerializer(self.record).data
+        self.assertEqual(dict(expected), dict(result))
+
+    def test_matches_record_serializer_output_many(self):
+        expected = RecordSerializer([self.record], many=True).data
+        result = RecordListSerializer([self.record], many=True).data
+        self.assertEqual([dict(x) for x in expected], [dict(x) for x in result])
@@ -21,17 +21,21 @@ class DnsRecordListView(ListView):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.subdomain = None
+        self.dns_records = None
 
     def dispatch(self, request, *args, **kwargs):
         self.subdomain = get_object_or_404(Subdomain, uuid=kwargs['subdomain_id'], user=request.user)
         return super(DnsRecordListView, self).dispatch(request, *args, **kwargs)
 
     def get_queryset(self):
-        provider = get_dns_record_provider(self.subdomain.domain)
-        records = Record.list_dns_records(provider, self.subdomain)
-        self.subdomain.records = len(records)
-        self.subdomain.save()
-        return records
+        if self.dns_records is None:
+            provider = get_dns_record_provider(self.subdomain.domain)
+            self.dns_records = Record.list_dns_records(provider, self.subdomain)
+            records = len(self.dns_records)
+            if records != self.subdomain.records:
+                Subdomain.objects.filter(pk=self.subdomain.pk).update(records=records)
+                self.subdomain.records = records
+        return self.dns_records
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(DnsRecordListView, self).get_context_data(**kwargs)
@@ -96,8 +100,10 @@ class DnsRecordUpdateView(FormView):
         self.record = None
 
     def dispatch(self, request, *args, **kwargs):
-        self.subdomain = get_object_or_404(Subdomain, uuid=kwargs['subdomain_id'], user=request.user)
-        self.record = get_object_or_404(Record, uuid=kwargs['id'])
+        self.subdomain = get_object_or_404(Subdomain.objects.select_related('domain'), uuid=kwargs['subdomain_id'],
+                                           user=request.user)
+        self.record = get_object_or_404(Record, uuid=kwargs['id'], subdomain_name=self.subdomain.name,
+                                        domain=self.subdomain.domain)
         return super(DnsRecordUpdateView, self).dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -151,8 +157,10 @@ class DnsRecordDeleteView(FormView):
         self.record = None
 
     def dispatch(self, request, *args, **kwargs):
-        self.subdomain = get_object_or_404(Subdomain, uuid=kwargs['subdomain_id'], user=request.user)
-        self.record = get_object_or_404(Record, uuid=kwargs['id'])
+        self.subdomain = get_object_or_404(Subdomain.objects.select_related('domain'), uuid=kwargs['subdomain_id'],
+                                           user=request.user)
+        self.record = get_object_or_404(Record, uuid=kwargs['id'], subdomain_name=self.subdomain.name,
+                                        domain=self.subdomain.domain)
         return super(DnsRecordDeleteView, self).dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
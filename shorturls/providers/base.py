@@ -3,6 +3,9 @@ from typing import Any
 
 from domains.models import Domain
 
+# Connect/read timeouts for provider API calls, so a stalled upstream cannot pin a worker.
+REQUEST_TIMEOUT = (3.05, 10)
+
 
 class BaseShortUrlProvider(metaclass=ABCMeta):
     @abstractmethod
@@ -3,8 +3,9 @@ from typing import Any
 
 import requests
 
+from base.http_pool import get_session
 from domains.models import Domain
-from .base import BaseShortUrlProvider
+from .base import BaseShortUrlProvider, REQUEST_TIMEOUT
 from ..exceptions import ShortUrlProviderError
 
 
@@ -14,15 +15,16 @@ class BitlyShortUrlProvider(BaseShortUrlProvider):
     headers = {
         'Authorization': f'Bearer {token}',
     }
+    session = get_session(host)
 
     def list_short_urls(self, domain: Domain) -> list[dict[str, Any]]:
         raise ShortUrlProviderError()
 
     def create_short_url(self, domain: Domain, **kwargs) -> dict[str, Any]:
-        response = requests.post(self.host + '/v4/shorten', headers=self.headers, json={
+        response = self.session.post(self.host + '/v4/shorten', headers=self.headers, json={
             'long_url': kwargs.get('long_url'),
             'domain': domain.name,
-        })
+        }, timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
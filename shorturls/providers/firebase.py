@@ -3,14 +3,16 @@ from typing import Any
 
 import requests
 
+from base.http_pool import get_session
 from domains.models import Domain
-from .base import BaseShortUrlProvider
+from .base import BaseShortUrlProvider, REQUEST_TIMEOUT
 from ..exceptions import ShortUrlProviderError
 
 
 class FirebaseDynamicLinksShortUrlProvider(BaseShortUrlProvider):
     host = 'https://firebasedynamiclinks.googleapis.com'
     api_key = os.environ.get("FIREBASE_WEB_API_KEY")
+    session = get_session(host)
 
     def list_short_urls(self, domain: Domain) -> list[dict[str, Any]]:
         raise ShortUrlProviderError()
@@ -25,8 +27,8 @@ class FirebaseDynamicLinksShortUrlProvider(BaseShortUrlProvider):
                 'option': 'SHORT'
             }
         }
-        response = requests.post(self.host + '/v1/shortLinks',
-                                 params={'key': self.api_key}, json=request_body)
+        response = self.session.post(self.host + '/v1/shortLinks',
+                                     params={'key': self.api_key}, json=request_body, timeout=REQUEST_TIMEOUT)
         try:
             response.raise_for_status()
         except requests.HTTPError:
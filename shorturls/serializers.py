@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from base.serializers import CachedFieldsSerializerMixin
 from .models import ShortUrl
 
 
-class ShortUrlSerializer(serializers.ModelSerializer):
+class ShortUrlSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -27,3 +28,15 @@ class ShortUrlSerializer(serializers.ModelSerializer):
             'short',
             'short_url',
         )
+
+
+class ShortUrlListSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    uuid = serializers.UUIDField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    domain_uuid = serializers.ReadOnlyField()
+    domain_name = serializers.ReadOnlyField()
+    name = serializers.CharField(read_only=True)
+    short = serializers.CharField(read_only=True)
+    long_url = serializers.URLField(read_only=True)
+    short_url = serializers.ReadOnlyField()
@@ -17,7 +17,7 @@ class Subdomain(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     user = models.ForeignKey(AUTH_USER_MODEL, on_delete=models.RESTRICT)
-    name = models.CharField(max_length=63, validators=[validate_domain_name, validate_reserved_name])
+    name = models.CharField(max_length=63, db_index=True, validators=[validate_domain_name, validate_reserved_name])
     domain = models.ForeignKey(Domain, on_delete=models.RESTRICT)
 
     expiry = models.DateTimeField()
@@ -98,52 +98,60 @@ class Subdomain(models.Model):
         return True
 
     def get_contact_url(self, contact: str) -> str:
-        from django.urls import reverse_lazy
-        return f'{reverse_lazy("subdomains:contact")}?subdomain={self.full_name}&contact={contact}'
+        from django.urls import reverse
+        return f'{reverse("subdomains:contact")}?subdomain={self.full_name}&contact={contact}'
 
     def to_whois(self) -> Dict[str, Any]:
+        from django.urls import reverse
+        contact_url = f'{reverse("subdomains:contact")}?subdomain={self.full_name}&contact='
         return {
             'subdomain_name': self.full_name,
             'updated_date': self.updated_at,
             'creation_date': self.created_at,
             'expiry_date': self.expiry,
             'registrant': self.registrant.to_whois(is_private=self.is_private,
-                                                   contact_url=self.get_contact_url('registrant'),
+                                                   contact_url=contact_url + 'registrant',
                                                    public_fields=['organization', 'state_province', 'country']),
             'admin': self.admin.to_whois(is_private=self.is_private,
-                                         contact_url=self.get_contact_url('admin')),
+                                         contact_url=contact_url + 'admin'),
             'tech': self.tech.to_whois(is_private=self.is_private,
-                                       contact_url=self.get_contact_url('tech')),
+                                       contact_url=contact_url + 'tech'),
         }
 
     def __str__(self):
         return self.full_name
 
+    @classmethod
+    def is_valid_name(cls, name: str) -> bool:
+        return 3 <= len(name) <= 63 and re.match('^[a-z0-9][a-z0-9-]*[a-z0-9]$', name) is not None
+
     @classmethod
     def is_available(cls, name: str, domain: Domain) -> bool:
         name = name.lower()
-        return 3 <= len(name) <= 63 and re.match('^[a-z0-9][a-z0-9-]*[a-z0-9]$', name) is not None and len(
-            cls.objects.filter(name=name, domain=domain)) == 0 and len(
-            ReservedName.objects.filter(name=name)) == 0
+        return cls.is_valid_name(name) and not cls.objects.filter(
+            name=name, domain=domain).exists() and not ReservedName.objects.filter(name=name).exists()
 
     @classmethod
     def search(cls, name: str, domains: List[Domain], hide_unavailable: bool = False) -> Dict[Tuple[str, Domain], bool]:
+        name = name.lower()
+        is_valid = cls.is_valid_name(name) and not ReservedName.objects.filter(name=name).exists()
+        taken_domain_ids = set(
+            cls.objects.filter(name=name, domain__in=domains).values_list('domain_id', flat=True)) if is_valid else set()
         result = {}
         for domain in domains:
-            is_available = cls.is_available(name, domain)
+            is_available = is_valid and domain.id not in taken_domain_ids
             if is_available or not hide_unavailable:
                 result[(name, domain)] = is_available
         return result
 
     @classmethod
     def find_by_full_name(cls, full_name: str) -> Optional['Subdomain']:
-        if '.' not in full_name:
+        name, _, domain__name = full_name.removesuffix('.').partition('.')
+        if not domain__name:
             return None
-        i = full_name.index('.')
-        name = full_name[:i]
-        domain__name = full_name[i + 1:]
         try:
-            return cls.objects.get(name=name, domain__name=domain__name)
+            return cls.objects.select_related('domain', 'registrant', 'admin', 'tech', 'billing').get(
+                name=name, domain__name=domain__name)
         except cls.DoesNotExist:
             return None
 
@@ -3,13 +3,15 @@ import datetime
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
+from base.serializers import CachedFieldsSerializerMixin
 from contacts.models import Contact
 from .models import Subdomain
 
 
-class SubdomainSerializer(serializers.ModelSerializer):
+class SubdomainSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
-    expiry = serializers.DateTimeField(default=datetime.datetime.now() + datetime.timedelta(days=90), read_only=True)
+    expiry = serializers.DateTimeField(default=lambda: datetime.datetime.now() + datetime.timedelta(days=90),
+                                       read_only=True)
 
     class Meta:
         model = Subdomain
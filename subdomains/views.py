@@ -38,7 +38,8 @@ class SearchView(FormView, ListView):
 
     def dispatch(self, request, *args, **kwargs):
         self.q = request.GET.get('q', '').lower()
-        self.domain = request.GET.getlist('domain', list(map(lambda e: e.id, Domain.objects.filter(is_active=True))))
+        self.domain = request.GET.getlist('domain', list(Domain.objects.filter(is_active=True)
+                                                         .values_list('id', flat=True)))
         self.hide_unavailable = request.GET.get('hide_unavailable', 'off') == 'on'
         return super(SearchView, self).dispatch(request, *args, **kwargs)
 
@@ -91,11 +92,11 @@ class SubdomainContactView(FormView):
 
     def form_valid(self, form):
         subdomain_name = form.cleaned_data.get('subdomain_name')
-        if '.' in subdomain_name:
-            i = subdomain_name.index('.')
-            name = subdomain_name[:i]
-            domain__name = subdomain_name[i + 1:]
-            subdomain = get_object_or_404(Subdomain, name=name, domain__name=domain__name)
+        name, _, domain__name = subdomain_name.removesuffix('.').partition('.')
+        if domain__name:
+            subdomain = get_object_or_404(
+                Subdomain.objects.select_related('registrant', 'admin', 'tech', 'billing'),
+                name=name, domain__name=domain__name)
             contacts = form.cleaned_data.get('contacts')
             recipient_list = set()
             if 'registrant' in contacts:
@@ -126,7 +127,7 @@ class SubdomainCreateView(CreateView):
     }
 
     def get(self, request, *args, **kwargs):
-        if len(Contact.objects.filter(user=request.user)) == 0:
+        if not Contact.objects.filter(user=request.user).exists():
             messages.add_message(request, messages.INFO, 'Before creating a subdomain, you must create a contact.')
             return redirect(reverse('contacts:create'))
         return super(SubdomainCreateView, self).get(request, *args, **kwargs)